@@ -1,18 +1,33 @@
 #!/usr/bin/env python
-import json
+import sys
 from pathlib import Path
-from datetime import timedelta
 import dawtool
+import orjson
 
 here = Path(__file__).parent
 
-project_filename = (here / 'audiosync/sample.flp')
-# project_filename = Path('/home/ewen/projects/music/.staging/databreach.flp')
+project_filename = Path(sys.argv[1]) if len(sys.argv) > 1 else here / 'audiosync/sample.flp'
+cache_filename = here / 'audiosync' / '.landmarks.cache.json'
 
-with project_filename.open('rb') as file:
-    project = dawtool.load_project(project_filename, file)
-    project.parse()
+stat = project_filename.stat()
 
-(here / "audiosync" / "bpm.txt").write_text(str(int(project.beats_per_min)))
-(here / "audiosync" / "landmarks.json").write_text(json.dumps({  str(int(marker.time*1000)): marker.text for marker in project.markers }))
-    
+cache = None
+if cache_filename.exists():
+    cache = orjson.loads(cache_filename.read_bytes())
+    if cache['mtime'] != stat.st_mtime or cache['size'] != stat.st_size:
+        cache = None
+
+if cache is None:
+    with project_filename.open('rb') as file:
+        project = dawtool.load_project(project_filename, file)
+        project.parse()
+    cache = {
+        'mtime': stat.st_mtime,
+        'size': stat.st_size,
+        'bpm': int(project.beats_per_min),
+        'landmarks': { int(marker.time*1000): marker.text for marker in project.markers },
+    }
+    cache_filename.write_bytes(orjson.dumps(cache, option=orjson.OPT_NON_STR_KEYS))
+
+(here / "audiosync" / "bpm.txt").write_text(str(cache['bpm']))
+(here / "audiosync" / "landmarks.json").write_bytes(orjson.dumps(cache['landmarks'], option=orjson.OPT_NON_STR_KEYS))